@@ -1,8 +1,31 @@
 import streamlit as st
-from job_source import extract_text_from_upload, fetch_all_jobs, score_jobs
+from job_source import extract_text_from_bytes, fetch_all_jobs, score_jobs
 
 st.set_page_config(page_title="NI UK Civil Service Job Matcher", layout="wide")
 
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def parse_cv(name: str, data: bytes) -> str:
+    # keyed on the upload bytes, so reruns don't re-parse the same PDF/DOCX
+    return extract_text_from_bytes(name, data)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_fetch_all_jobs(use_careerjet: bool, use_indeed: bool, strict_gov_only: bool, extra_keywords: str):
+    return fetch_all_jobs(
+        use_careerjet=use_careerjet,
+        use_indeed=use_indeed,
+        strict_gov_only=strict_gov_only,
+        extra_keywords=extra_keywords,
+    )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_score_jobs(cv_text: str, jobs: tuple) -> list:
+    # keyed on the CV text plus the fetched Job contents (st.cache_data hashes the values)
+    return score_jobs(cv_text, list(jobs))
+
+
 BUILD = "2026-01-13 v6 (RSS-only, no NIJobs scraping, multi-profile scoring)"
 st.title("NI UK Civil Service Job Matcher")
 st.caption(f"BUILD: {BUILD}")
@@ -26,6 +49,7 @@ with st.sidebar:
     st.subheader("Results")
     min_score = st.slider("Minimum match score", 40, 95, 50, 1)
     max_results = st.slider("Max results to show", 10, 100, 40, 5)
+    detailed_view = st.toggle("Detailed view", value=False)
     show_diagnostics = st.toggle("Show diagnostics", value=True)
 
     st.divider()
@@ -36,11 +60,11 @@ with st.sidebar:
 # CV text (paste overrides upload)
 cv_text = ""
 if uploaded is not None:
-    cv_text = extract_text_from_upload(uploaded)
+    cv_text = parse_cv(uploaded.name, uploaded.getvalue())
 if pasted.strip():
     cv_text = pasted.strip()
 
-run = st.button("Find matches", type="primary", use_container_width=True)
+run = st.button("Find matches", type="primary", width="stretch")
 
 if "searched" not in st.session_state:
     st.session_state.searched = False
@@ -52,17 +76,21 @@ if "diag" not in st.session_state:
 if run:
     st.session_state.searched = True
 
-    with st.spinner("Fetching jobs (RSS)…"):
-        jobs, diag = fetch_all_jobs(
-            use_careerjet=use_careerjet,
-            use_indeed=use_indeed,
-            strict_gov_only=strict_gov_only,
-            extra_keywords=extra_keywords.strip(),
+    with st.status("Fetching jobs (RSS)…", expanded=True) as status:
+        jobs, diag = cached_fetch_all_jobs(
+            use_careerjet,
+            use_indeed,
+            strict_gov_only,
+            extra_keywords.strip(),
         )
         st.session_state.diag = diag
+        st.write(f"Fetched **{len(jobs)}** jobs.")
+
+        status.update(label="Scoring matches…")
+        scored = cached_score_jobs(cv_text, tuple(jobs))
+        st.write(f"Scored **{len(scored)}** jobs against your CV.")
 
-    with st.spinner("Scoring matches…"):
-        scored = score_jobs(cv_text, jobs)
+        status.update(label=f"Done — {len(scored)} jobs scored", state="complete", expanded=False)
 
     # Filter by score, but never show “nothing” if we fetched jobs
     filtered = [r for r in scored if r["score"] >= min_score]
@@ -88,30 +116,62 @@ else:
     else:
         st.write(f"Showing **{len(st.session_state.results)}** matches (from **{fetched_total}** fetched).")
 
-        for r in st.session_state.results:
-            with st.container(border=True):
-                cols = st.columns([4, 1])
-                with cols[0]:
-                    st.markdown(f"### [{r['title']}]({r['url']})")
-                    meta = []
-                    if r.get("company"):
-                        meta.append(r["company"])
-                    if r.get("location"):
-                        meta.append(r["location"])
-                    meta.append(f"Source: {r.get('source','')}")
-                    if r.get("profile"):
-                        meta.append(f"Matched via: {r['profile']}")
-                    st.write(" • ".join([m for m in meta if m]))
-
-                    if r.get("summary"):
-                        st.write(r["summary"])
-
-                    if r.get("why"):
-                        st.caption("Matched terms: " + ", ".join(r["why"][:12]))
-
-                with cols[1]:
-                    st.metric("Match", f"{r['score']}%")
-                    st.progress(r["score"] / 100)
+        if not detailed_view:
+            # one virtualised table instead of a widget tree per result
+            st.dataframe(
+                [
+                    {
+                        "score": r["score"],
+                        "title": r["title"],
+                        "url": r["url"],
+                        "company": r.get("company", ""),
+                        "location": r.get("location", ""),
+                        "source": r.get("source", ""),
+                        "profile": r.get("profile", ""),
+                        "why": r.get("why", [])[:12],
+                        "summary": r.get("summary", ""),
+                    }
+                    for r in st.session_state.results
+                ],
+                hide_index=True,
+                width="stretch",
+                column_config={
+                    "score": st.column_config.ProgressColumn("Match", format="%d%%", min_value=0, max_value=100),
+                    "title": "Title",
+                    "url": st.column_config.LinkColumn("Link", display_text="Open"),
+                    "company": "Company",
+                    "location": "Location",
+                    "source": "Source",
+                    "profile": "Matched via",
+                    "why": st.column_config.ListColumn("Matched terms"),
+                    "summary": "Summary",
+                },
+            )
+        else:
+            for r in st.session_state.results:
+                with st.container(border=True):
+                    cols = st.columns([4, 1])
+                    with cols[0]:
+                        st.markdown(f"### [{r['title']}]({r['url']})")
+                        meta = []
+                        if r.get("company"):
+                            meta.append(r["company"])
+                        if r.get("location"):
+                            meta.append(r["location"])
+                        meta.append(f"Source: {r.get('source','')}")
+                        if r.get("profile"):
+                            meta.append(f"Matched via: {r['profile']}")
+                        st.write(" • ".join([m for m in meta if m]))
+
+                        if r.get("summary"):
+                            st.write(r["summary"])
+
+                        if r.get("why"):
+                            st.caption("Matched terms: " + ", ".join(r["why"][:12]))
+
+                    with cols[1]:
+                        st.metric("Match", f"{r['score']}%")
+                        st.progress(r["score"] / 100)
 
 if show_diagnostics and st.session_state.searched:
     st.divider()
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import heapq
 import io
 import re
+import threading
 import html as ihtml
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
 from urllib.parse import quote_plus
 
 import requests
@@ -12,7 +18,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import feedparser
 
-from pypdf import PdfReader
+import pypdfium2 as pdfium
 import docx
 
 
@@ -27,29 +33,33 @@ _RETRY = Retry(
     allowed_methods=("GET",),
     raise_on_status=False,
 )
-_SESSION.mount("https://", HTTPAdapter(max_retries=_RETRY))
-_SESSION.mount("http://", HTTPAdapter(max_retries=_RETRY))
+# one pooled adapter for both schemes so keep-alive sockets are reused across threads
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32, pool_block=False, max_retries=_RETRY)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
 
 _UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
 )
+_SESSION.headers.update({"User-Agent": _UA, "Accept-Language": "en-GB,en;q=0.9"})
 
-def _get(url: str, timeout=(10, 60)) -> requests.Response:
-    return _SESSION.get(
-        url,
-        headers={"User-Agent": _UA, "Accept-Language": "en-GB,en;q=0.9"},
-        timeout=timeout,
-    )
+# RSS fetches are network-bound, so queries go out in parallel threads
+_FETCH_WORKERS = 8
+
+def _get(url: str, timeout=(10, 60), headers: Dict[str, str] | None = None) -> requests.Response:
+    return _SESSION.get(url, headers=headers, timeout=timeout)
+
+_TAG_RE = re.compile(r"<[^>]+>")
 
 def _strip_html(s: str) -> str:
     s = ihtml.unescape(s or "")
-    s = re.sub(r"<[^>]+>", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = _TAG_RE.sub(" ", s)
+    # split/join collapses and trims whitespace in one C pass
+    return " ".join(s.split())
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Job:
     source: str
     title: str
@@ -60,39 +70,79 @@ class Job:
 
 
 # ---------------- CV extraction ----------------
+# bound worst-case CV parse time; anything past this is noise for scoring
+_CV_CHAR_BUDGET = 20_000
+_MAX_DOCX_BYTES = 5_000_000
+_PDFIUM_LOCK = threading.Lock()
+
 def extract_text_from_upload(uploaded_file) -> str:
-    name = (uploaded_file.name or "").lower()
-    data = uploaded_file.getvalue()
+    return extract_text_from_bytes(uploaded_file.name, uploaded_file.getvalue())
+
+def extract_text_from_bytes(name: str, data: bytes) -> str:
+    name = (name or "").lower()
     try:
         if name.endswith(".txt"):
             return data.decode("utf-8", errors="ignore").strip()
 
         if name.endswith(".pdf"):
-            reader = PdfReader(io.BytesIO(data))
-            return "\n".join((p.extract_text() or "") for p in reader.pages[:20]).strip()
+            # PDFium is not thread-safe, even across documents, and each Streamlit
+            # session runs on its own thread
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(data)
+                try:
+                    out = []
+                    total = 0
+                    for i in range(min(len(pdf), 20)):
+                        page = pdf[i]
+                        tp = page.get_textpage()
+                        t = tp.get_text_range()
+                        tp.close()
+                        page.close()
+                        out.append(t)
+                        total += len(t)
+                        if total > _CV_CHAR_BUDGET:
+                            break
+                    return "\n".join(out).strip()
+                finally:
+                    pdf.close()
 
         if name.endswith(".docx"):
+            if len(data) > _MAX_DOCX_BYTES:
+                return ""
             d = docx.Document(io.BytesIO(data))
-            return "\n".join(p.text for p in d.paragraphs).strip()
+            out = []
+            total = 0
+            for p in d.paragraphs:
+                out.append(p.text)
+                total += len(p.text)
+                if total > _CV_CHAR_BUDGET:
+                    break
+            return "\n".join(out).strip()
     except Exception:
         return ""
     return ""
 
 
 # ---------------- Tokenising + similarity ----------------
-_STOP = {
+_STOP = frozenset({
     "the","and","or","a","an","to","of","in","for","on","with","at","by","from","as","is","are","be",
     "this","that","it","you","your","we","our","they","their","will","can","may","not","have","has",
     "i","me","my","he","she","them","but","if","so","than","then","into","over","under","within",
-}
+})
+
+# the {2,} quantifier enforces the 3-char minimum inside the regex engine
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9\-\_]{2,}")
 
-def _tokens(text: str) -> List[str]:
-    words = re.findall(r"[a-z0-9][a-z0-9\-\_]{1,}", (text or "").lower())
-    return [w for w in words if w not in _STOP and len(w) > 2]
+def _tokens_lower(low: str) -> List[str]:
+    # `low` must already be lowercased
+    return [w for w in _TOKEN_RE.findall(low) if w not in _STOP]
 
-def _similarity(a: str, b: str) -> Tuple[float, List[str]]:
-    A = set(_tokens(a))
-    B = set(_tokens(b))
+@lru_cache(maxsize=2048)
+def _token_set(low: str) -> frozenset:
+    # job texts survive across reruns (fetches are cached), so only a new CV pays
+    return frozenset(_tokens_lower(low))
+
+def _similarity(A: frozenset, B: frozenset) -> Tuple[float, List[str]]:
     if not B:
         return 0.0, []
     if not A:
@@ -100,7 +150,7 @@ def _similarity(a: str, b: str) -> Tuple[float, List[str]]:
     inter = A.intersection(B)
     sim = len(inter) / max(1.0, (len(A) * len(B)) ** 0.5)
     sim = max(0.0, min(1.0, sim))
-    return sim, sorted(inter)[:20]
+    return sim, heapq.nsmallest(20, inter)
 
 def _human_score(sim: float) -> int:
     # human-looking band: avoids depressing 0–20% scores
@@ -129,23 +179,121 @@ def _looks_ni(text: str) -> bool:
     return any(x in t for x in NI_TERMS)
 
 def _looks_gov(text: str) -> bool:
-    t = (text or "").lower()
+    return _looks_gov_lower((text or "").lower())
+
+def _looks_gov_lower(t: str) -> bool:
     if any(x in t for x in NEGATIVE_NOT_UKCS):
         return False
     return any(x in t for x in GOV_TERMS)
 
 
 # ---------------- RSS fetch helper ----------------
+# url -> (ETag, Last-Modified, parsed entries) from the last 200, for conditional GETs.
+# LRU-capped: every distinct keyword search adds new URLs for the life of the process.
+_FEED_CACHE_MAX = 128
+_FEED_CACHE: "OrderedDict[str, Tuple[str, str, List[dict]]]" = OrderedDict()
+_FEED_CACHE_LOCK = threading.Lock()
+
+def _feed_cache_get(url: str) -> Tuple[str, str, List[dict]] | None:
+    with _FEED_CACHE_LOCK:
+        cached = _FEED_CACHE.get(url)
+        if cached is not None:
+            _FEED_CACHE.move_to_end(url)
+        return cached
+
+def _feed_cache_put(url: str, value: Tuple[str, str, List[dict]]) -> None:
+    with _FEED_CACHE_LOCK:
+        _FEED_CACHE[url] = value
+        _FEED_CACHE.move_to_end(url)
+        while len(_FEED_CACHE) > _FEED_CACHE_MAX:
+            _FEED_CACHE.popitem(last=False)
+
+def _feed_cache_drop(url: str) -> None:
+    with _FEED_CACHE_LOCK:
+        _FEED_CACHE.pop(url, None)
+
+# namespaced elements feedparser folds into the summary (content:encoded, dc:description,
+# media:description, itunes:summary, ...); the fast path only reads plain <description>
+_SUMMARY_LOCAL_NAMES = frozenset({"encoded", "description", "summary"})
+
+def _has_namespaced_summary(item: ET.Element) -> bool:
+    for child in item.iter():
+        tag = child.tag
+        if tag.startswith("{") and tag.rpartition("}")[2] in _SUMMARY_LOCAL_NAMES:
+            return True
+    return False
+
+def _parse_rss_items(body: bytes) -> List[dict]:
+    # RSS 2.0 fast path: stream <item>s, keep only the fields the fetchers read.
+    # Returns [] for any item it can't represent the way feedparser would, so the
+    # caller falls back to feedparser for the whole feed.
+    items: List[dict] = []
+    for _, el in ET.iterparse(io.BytesIO(body), events=("end",)):
+        if el.tag != "item":
+            continue
+        if _has_namespaced_summary(el):
+            return []
+        # inline markup in <title> would be cut at the first child by findtext
+        title_el = el.find("title")
+        if title_el is not None and len(title_el):
+            return []
+
+        link = (el.findtext("link") or "").strip()
+        if not link:
+            guid = el.find("guid")
+            if guid is not None and (guid.get("isPermaLink") or "true").lower() == "true":
+                link = (guid.text or "").strip()
+        if not link:
+            return []
+
+        # inline (unescaped) HTML parses as child elements; join the text around
+        # them with spaces, matching what _strip_html does to feedparser's markup
+        desc = el.find("description")
+        summary = " ".join(desc.itertext()) if desc is not None else ""
+
+        items.append({
+            "title": (title_el.text if title_el is not None else None) or "",
+            "link": link,
+            "summary": summary,
+        })
+        el.clear()
+    return items
+
 def _fetch_rss(url: str) -> Tuple[List[dict], dict]:
     diag = {"url": url, "status": None, "entries": 0}
     try:
-        r = _get(url, timeout=(10, 60))
+        cached = _feed_cache_get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        r = _get(url, timeout=(10, 60), headers=headers or None)
         diag["status"] = r.status_code
+        if r.status_code == 304 and cached:
+            diag["entries"] = len(cached[2])
+            return cached[2], diag
         if r.status_code != 200:
             return [], diag
-        feed = feedparser.parse(r.text)
-        entries = list(feed.entries or [])
+        try:
+            entries = _parse_rss_items(r.content)
+        except ET.ParseError:
+            entries = []
+        if not entries:
+            # Atom, RSS 1.0 or malformed XML: fall back to feedparser's tolerant parser.
+            # bytes skip requests' charset sniffing; summaries go through _strip_html anyway
+            feed = feedparser.parse(r.content, sanitize_html=False, resolve_relative_uris=False)
+            entries = list(feed.entries or [])
         diag["entries"] = len(entries)
+        etag = r.headers.get("ETag") or ""
+        last_modified = r.headers.get("Last-Modified") or ""
+        if etag or last_modified:
+            _feed_cache_put(url, (etag, last_modified, entries))
+        else:
+            # server stopped sending validators: forget the stale ones
+            _feed_cache_drop(url)
         return entries, diag
     except Exception as e:
         diag["error"] = f"{type(e).__name__}: {e}"
@@ -168,22 +316,32 @@ def fetch_careerjet_rss(extra_keywords: str = "", location: str = "Northern Irel
     ]
     if extra_keywords:
         queries.insert(0, extra_keywords)
+    # a keyword matching a default query would otherwise fetch the same URL twice
+    queries = list(dict.fromkeys(queries))
+
+    urls = [
+        f"https://rss.careerjet.co.uk/rss?s={quote_plus(q)}&l={quote_plus(location)}&sort=date"
+        for q in queries
+    ]
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as ex:
+        fetched = list(ex.map(_fetch_rss, urls))
 
     jobs: List[Job] = []
     diags: List[dict] = []
+    seen: Set[str] = set()
 
-    for q in queries:
-        url = f"https://rss.careerjet.co.uk/rss?s={quote_plus(q)}&l={quote_plus(location)}&sort=date"
-        entries, d = _fetch_rss(url)
+    for entries, d in fetched:
         diags.append(d)
 
         for e in entries[:40]:
-            title = (e.get("title") or "").strip()
             link = (e.get("link") or "").strip()
-            summary = _strip_html(e.get("summary") or e.get("description") or "")
-
-            if not link:
+            # the same ad turns up under several queries; only process it once
+            if not link or link in seen:
                 continue
+            seen.add(link)
+
+            title = (e.get("title") or "").strip()
+            summary = _strip_html(e.get("summary") or e.get("description") or "")
 
             blob = f"{title}\n{summary}\n{link}"
             if not _looks_ni(blob):
@@ -198,8 +356,7 @@ def fetch_careerjet_rss(extra_keywords: str = "", location: str = "Northern Irel
                 summary=summary[:700],
             ))
 
-    uniq = {j.url: j for j in jobs if j.url}
-    return list(uniq.values()), diags
+    return jobs, diags
 
 
 def fetch_indeed_rss(extra_keywords: str = "", location: str = "Northern Ireland") -> Tuple[List[Job], List[dict]]:
@@ -213,22 +370,28 @@ def fetch_indeed_rss(extra_keywords: str = "", location: str = "Northern Ireland
     ]
     if extra_keywords:
         queries.insert(0, f"{extra_keywords} Belfast")
+    queries = list(dict.fromkeys(queries))
+
+    urls = [f"https://rss.indeed.com/rss?q={quote_plus(q)}&l={quote_plus(location)}" for q in queries]
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as ex:
+        fetched = list(ex.map(_fetch_rss, urls))
 
     jobs: List[Job] = []
     diags: List[dict] = []
+    seen: Set[str] = set()
 
-    for q in queries:
-        url = f"https://rss.indeed.com/rss?q={quote_plus(q)}&l={quote_plus(location)}"
-        entries, d = _fetch_rss(url)
+    for entries, d in fetched:
         diags.append(d)
 
         for e in entries[:50]:
-            raw_title = (e.get("title") or "").strip()
             link = (e.get("link") or "").strip()
-            summary = _strip_html(e.get("summary") or e.get("description") or "")
-
-            if not link:
+            # the same ad turns up under several queries; only process it once
+            if not link or link in seen:
                 continue
+            seen.add(link)
+
+            raw_title = (e.get("title") or "").strip()
+            summary = _strip_html(e.get("summary") or e.get("description") or "")
 
             blob = f"{raw_title}\n{summary}\n{link}"
             if not _looks_ni(blob):
@@ -249,27 +412,30 @@ def fetch_indeed_rss(extra_keywords: str = "", location: str = "Northern Ireland
                 summary=summary[:700],
             ))
 
-    uniq = {j.url: j for j in jobs if j.url}
-    return list(uniq.values()), diags
+    return jobs, diags
 
 
 # ---------------- Multi-profile CV scoring ----------------
 TECH_HINTS = {"python","javascript","html","css","sql","api","github","vscode","software","developer","programming"}
 OPS_HINTS  = {"hotel","housekeeping","supervisor","rota","inventory","stock","audit","hygiene","customer","service","training","team"}
 SALES_HINTS = {"broker","real","estate","sales","leads","marketing","clients","prospecting","closing","crm"}
+_ALL_HINTS = frozenset(TECH_HINTS | OPS_HINTS | SALES_HINTS)
 
 def build_cv_profiles(cv_text: str) -> Dict[str, str]:
-    lines = [ln.strip() for ln in (cv_text or "").splitlines() if ln.strip()]
     tech, ops, sales = [], [], []
 
-    for ln in lines:
-        low = ln.lower()
-        toks = set(_tokens(low))
-        if toks & TECH_HINTS:
+    for ln in (cv_text or "").splitlines():
+        ln = ln.strip()
+        if not ln:
+            continue
+        hits = _ALL_HINTS.intersection(_tokens_lower(ln.lower()))
+        if not hits:
+            continue
+        if not hits.isdisjoint(TECH_HINTS):
             tech.append(ln)
-        if toks & OPS_HINTS:
+        if not hits.isdisjoint(OPS_HINTS):
             ops.append(ln)
-        if toks & SALES_HINTS:
+        if not hits.isdisjoint(SALES_HINTS):
             sales.append(ln)
 
     profiles = {
@@ -294,40 +460,45 @@ def fetch_all_jobs(
     extra_keywords: str = "",
 ) -> Tuple[List[Job], Dict]:
     diag: Dict = {"counts": {}, "errors": [], "feeds": []}
-    jobs: List[Job] = []
+    seen: Set[str] = set()
+    kept: List[Job] = []
+    relaxed: List[Job] = []
 
+    sources = []
     if use_careerjet:
-        try:
-            cj, d = fetch_careerjet_rss(extra_keywords=extra_keywords)
-            jobs.extend(cj)
-            diag["counts"]["Careerjet RSS"] = len(cj)
-            diag["feeds"].extend(d)
-        except Exception as e:
-            diag["counts"]["Careerjet RSS"] = 0
-            diag["errors"].append(f"Careerjet RSS failed: {type(e).__name__}: {e}")
-
+        sources.append(("Careerjet RSS", fetch_careerjet_rss))
     if use_indeed:
-        try:
-            ij, d = fetch_indeed_rss(extra_keywords=extra_keywords)
-            jobs.extend(ij)
-            diag["counts"]["Indeed RSS"] = len(ij)
+        sources.append(("Indeed RSS", fetch_indeed_rss))
+
+    # Both sources fetch concurrently; results are still merged in source order
+    with ThreadPoolExecutor(max_workers=max(1, len(sources))) as ex:
+        futures = [(name, ex.submit(fn, extra_keywords=extra_keywords)) for name, fn in sources]
+        for name, fut in futures:
+            try:
+                found, d = fut.result()
+            except Exception as e:
+                diag["counts"][name] = 0
+                diag["errors"].append(f"{name} failed: {type(e).__name__}: {e}")
+                continue
+            diag["counts"][name] = len(found)
             diag["feeds"].extend(d)
-        except Exception as e:
-            diag["counts"]["Indeed RSS"] = 0
-            diag["errors"].append(f"Indeed RSS failed: {type(e).__name__}: {e}")
 
-    # Dedup by URL
-    uniq = {j.url: j for j in jobs if j.url}
-    jobs = list(uniq.values())
+            # Dedup by URL and bucket by gov-ish in the same pass
+            for j in found:
+                if not j.url or j.url in seen:
+                    continue
+                seen.add(j.url)
+                if not strict_gov_only or _looks_gov(f"{j.title}\n{j.summary}\n{j.company}\n{j.url}"):
+                    kept.append(j)
+                else:
+                    relaxed.append(j)
 
     # Gov-only filter (but never “force 0”)
-    if strict_gov_only and jobs:
-        kept = [j for j in jobs if _looks_gov(f"{j.title}\n{j.summary}\n{j.company}\n{j.url}")]
-        if kept:
-            jobs = kept
-            diag["counts"]["Gov-ish kept"] = len(jobs)
-        else:
-            diag["counts"]["Gov-ish kept"] = 0
+    jobs = kept
+    if strict_gov_only and (kept or relaxed):
+        diag["counts"]["Gov-ish kept"] = len(kept)
+        if not kept:
+            jobs = relaxed
             diag["errors"].append("Gov-only filter removed everything; relaxed to show NI jobs from feeds.")
 
     diag["counts"]["Deduped total"] = len(jobs)
@@ -336,19 +507,23 @@ def fetch_all_jobs(
 
 def score_jobs(cv_text: str, jobs: List[Job]) -> List[Dict]:
     profiles = build_cv_profiles(cv_text or "")
+    # profiles don't change across jobs: tokenise each once, not once per job
+    profile_sets = [(name, _token_set(ptext.lower())) for name, ptext in profiles.items()]
 
     results: List[Dict] = []
     for j in jobs:
-        job_text = f"{j.title}\n{j.company}\n{j.location}\n{j.summary}\n{j.url}"
+        # lowercase once; tokens and the gov boost both read the same blob
+        job_low = f"{j.title}\n{j.company}\n{j.location}\n{j.summary}\n{j.url}".lower()
+        job_set = _token_set(job_low)
 
         best = {"sim": 0.0, "why": [], "profile": "Full CV"}
-        for name, ptext in profiles.items():
-            sim, why = _similarity(ptext, job_text)
+        for name, A in profile_sets:
+            sim, why = _similarity(A, job_set)
             if sim > best["sim"]:
                 best = {"sim": sim, "why": why, "profile": name}
 
         score = _human_score(best["sim"])
-        if _looks_gov(job_text):
+        if _looks_gov_lower(job_low):
             score = min(98, score + 3)
 
         results.append({
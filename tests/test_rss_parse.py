@@ -0,0 +1,67 @@
+import feedparser
+import pytest
+
+from job_source import _parse_rss_items, _strip_html
+
+_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:media="http://search.yahoo.com/mrss/">
+<channel><title>t</title>
+{items}
+</channel></rss>"""
+
+SHAPES = {
+    "plain": "<item><title>HMRC Officer</title><link>https://x/1</link>"
+             "<description>Based in Belfast</description></item>",
+    "escaped html": "<item><title>A &amp; B</title><link>https://x/2</link>"
+                    "<description>&lt;p&gt;Job in &lt;b&gt;Lisburn&lt;/b&gt;&lt;/p&gt;</description></item>",
+    "cdata": "<item><title><![CDATA[Café Lead]]></title><link>https://x/3</link>"
+             "<description><![CDATA[<p>Derry &amp; Strabane</p>]]></description></item>",
+    "inline html": "<item><title>A</title><link>https://x/4</link>"
+                   "<description>Great job in <b>Newry</b> apply now</description></item>",
+    "inline html no spaces": "<item><title>D</title><link>https://x/5</link>"
+                             "<description>a<b>b</b>c</description></item>",
+    "permalink guid": "<item><title>B</title><guid isPermaLink=\"true\">https://x/6</guid>"
+                      "<description>Omagh</description></item>",
+    "default guid": "<item><title>B2</title><guid>https://x/7</guid></item>",
+    "content encoded": "<item><title>C</title><link>https://x/8</link>"
+                       "<content:encoded><![CDATA[<p>Armagh role</p>]]></content:encoded></item>",
+    "dc description": "<item><title>E</title><link>https://x/9</link>"
+                      "<dc:description>Omagh role</dc:description></item>",
+    "media description": "<item><title>F</title><link>https://x/10</link>"
+                         "<media:description>Omagh role</media:description></item>",
+    "inline html title": "<item><title>Officer <b>Belfast</b></title><link>https://x/11</link>"
+                         "<description>Apply now</description></item>",
+}
+
+
+def _normalise(entries):
+    return [
+        (
+            (e.get("title") or "").strip(),
+            (e.get("link") or "").strip(),
+            _strip_html(e.get("summary") or e.get("description") or ""),
+        )
+        for e in entries
+    ]
+
+
+def _parse(body: bytes):
+    # mirrors _fetch_rss: fast path first, feedparser when it returns nothing
+    entries = _parse_rss_items(body)
+    if not entries:
+        entries = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False).entries
+    return entries
+
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_fast_path_matches_feedparser(shape):
+    body = _RSS.format(items=SHAPES[shape]).encode("utf-8")
+    expected = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False).entries
+    assert _normalise(_parse(body)) == _normalise(expected)
+
+
+def test_fast_path_matches_feedparser_mixed_feed():
+    body = _RSS.format(items="".join(SHAPES.values())).encode("utf-8")
+    expected = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False).entries
+    assert _normalise(_parse(body)) == _normalise(expected)